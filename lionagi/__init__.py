@@ -15,15 +15,23 @@ Copyright 2023 HaiyangLi <ocean@lionagi.ai>
 """
 
 import logging
+import os
 from .version import __version__
-from dotenv import load_dotenv
 
-from .utils import *
-from .schema.base_schema import *
-from .structures import *
-from .api_service import *
-from .tools import *
+from .utils import (
+    as_dict, create_copy, get_bins, get_timestamp, str_to_num, to_df,
+    to_readable_dict, nfilter, nset, nget, nmerge, ninsert,
+    flatten, unflatten, is_structure_homogeneous, get_flattened_keys,
+    CoreUtil, APIUtil, IOUtil,
+    to_list, lcall, alcall, mcall, tcall, bcall, rcall, CallDecorator)
+from .schema.base_schema import (
+    BaseNode, Tool, DataLogger, DataNode, File, Chunk, StatusTracker)
+from .structures import Relationship, Structure
+from .tools import func_to_tool
 
 logger = logging.getLogger(__name__)
 logger.setLevel(logging.INFO)
-load_dotenv()
\ No newline at end of file
+
+if os.getenv("LIONAGI_AUTO_LOADENV", "true").lower() != "false":
+    from dotenv import load_dotenv
+    load_dotenv()
\ No newline at end of file
@@ -1,19 +1,18 @@
 import json
 from collections import deque
 from datetime import datetime
+from functools import lru_cache
 from typing import Any, Dict, List, Optional, Union
 
 import pandas as pd
 
 from lionagi.utils.sys_util import create_path, is_same_dtype
-from lionagi.utils import as_dict, lcall,to_df, to_list, CoreUtil
+from lionagi.utils import as_dict, to_df, to_list, CoreUtil
 
 
 from lionagi.services.base_service import BaseService, StatusTracker
 from lionagi.services.oai import OpenAIService
-from lionagi.services.openrouter import OpenRouterService
 from lionagi.configs.oai_configs import oai_schema
-from lionagi.configs.openrouter_configs import openrouter_schema
 from lionagi.schema import DataLogger, Tool
 from lionagi.tools.tool_manager import ToolManager
 from lionagi.core.branch_manager import Request
@@ -21,11 +20,12 @@ from lionagi.core.instruction_set import InstructionSet
 from lionagi.core.messages import Instruction, Message, Response, System
 from lionagi.core.flow import ChatFlow
 
-OAIService = None
-try:
-    OAIService = OpenAIService()
-except:
-    pass
+@lru_cache(maxsize=1)
+def _default_oai_service() -> Optional[OpenAIService]:
+    try:
+        return OpenAIService()
+    except Exception:
+        return None
 
 class Branch:
     """
@@ -256,12 +256,16 @@ class Branch:
         Returns:
             Dict[str, Any]: A dictionary containing the total number of messages, summary by role, and a list of the first maximum five message dictionaries.
         """
+        len_messages = len(self.messages)
         return {
-            "total_messages": len(self.messages),
+            "total_messages": len_messages,
             "summary_by_role": self._info(),
             "messages": [
-                msg.to_dict() for _, msg in self.messages.iterrows()
-            ][: self.len_messages -1 if self.len_messages < 5 else 5],
+                msg.to_dict()
+                for _, msg in self.messages.head(
+                    len_messages - 1 if len_messages < 5 else 5
+                ).iterrows()
+            ],
         }
 
 # ---- I/O ---- #
@@ -682,17 +686,16 @@ class Branch:
             >>> branch.delete_tool(["tool_one", "tool_two"])
         """
         if isinstance(tools, list):
+            registry = self.tool_manager.registry
             if is_same_dtype(tools, str):
                 for tool in tools:
-                    if tool in self.tool_manager.registry:
-                        self.tool_manager.registry.pop(tool)
+                    registry.pop(tool, None)
                 if verbose:
                     print("tools successfully deleted")
                 return True
             elif is_same_dtype(tools, Tool):
                 for tool in tools:
-                    if tool.name in self.tool_manager.registry:
-                        self.tool_manager.registry.pop(tool.name)
+                    registry.pop(tool.name, None)
                 if verbose:
                     print("tools successfully deleted")
                 return True
@@ -732,7 +735,36 @@ class Branch:
             message_dict['content'] = json.dumps(message_dict['content'])
         message_dict['timestamp'] = datetime.now().isoformat()
         self.messages.loc[len(self.messages)] = message_dict
-    
+
+    def add_messages(self, responses: List[Union[dict, list, Response]],
+                     sender: Optional[str] = None) -> None:
+        """
+        Adds multiple response messages to the branch's conversation in one insert.
+
+        Builds every row first and appends them with a single concat, avoiding the
+        per-row DataFrame insert cost of calling add_message in a loop.
+
+        Args:
+            responses (List[Union[dict, list, Response]]): Response messages to add.
+            sender (Optional[str]): Identifier for the sender of the messages.
+
+        Examples:
+            >>> branch.add_messages(responses=[{'content': 'Done'}, {'content': 'Next'}])
+        """
+        if not responses:
+            return
+        timestamp = datetime.now().isoformat()
+        rows = []
+        for response in responses:
+            msg = self._create_message(response=response, sender=sender)
+            message_dict = msg.to_dict()
+            if isinstance(as_dict(message_dict['content']), dict):
+                message_dict['content'] = json.dumps(message_dict['content'])
+            message_dict['timestamp'] = timestamp
+            rows.append(message_dict)
+        new_rows = pd.DataFrame(rows).reindex(columns=self.messages.columns)
+        self.messages = pd.concat([self.messages, new_rows], ignore_index=True)
+
     def remove_message(self, node_id: str) -> None:
         """
         Removes a message from the branch's conversation based on its node ID.
@@ -956,8 +988,11 @@ class Branch:
         skipped_requests = deque()
         if from_name not in self.pending_ins:
             raise ValueError(f'No package from {from_name}')
-        while self.pending_ins[from_name]:
-            request = self.pending_ins[from_name].popleft()
+        pending = self.pending_ins[from_name]
+        popleft = pending.popleft
+        received_tools = []
+        while pending:
+            request = popleft()
 
             if request.title == 'messages' and messages:
                 if not isinstance(request.request, pd.DataFrame):
@@ -969,7 +1004,7 @@ class Branch:
             elif request.title == 'tool' and tool:
                 if not isinstance(request.request, Tool):
                     raise ValueError('Invalid tool format')
-                self.tool_manager.register_tools([request.request])
+                received_tools.append(request.request)
 
             elif request.title == 'service' and service:
                 if not isinstance(request.request, BaseService):
@@ -984,6 +1019,8 @@ class Branch:
             else:
                 skipped_requests.append(request)
 
+        if received_tools:
+            self.tool_manager.register_tools(received_tools)
         self.pending_ins[from_name] = skipped_requests
 
     def receive_all(self):
@@ -999,37 +1036,39 @@ class Branch:
             self.receive(key)
     
     def _add_service(self, service, llmconfig):
-        service = service or OpenAIService()
+        service = service or _default_oai_service() or OpenAIService()
         self.service=service
         if llmconfig:
             self.llmconfig = llmconfig
         else:
             if isinstance(service, OpenAIService):
                 self.llmconfig = oai_schema["chat/completions"]["config"]
-            elif isinstance(service, OpenRouterService):
+            elif type(service).__name__ == "OpenRouterService":
+                from lionagi.configs.openrouter_configs import openrouter_schema
                 self.llmconfig = openrouter_schema["chat/completions"]["config"]
             else:
                 self.llmconfig = {}
 
     def _to_chatcompletion_message(self, with_sender=False) -> List[Dict[str, Any]]:
         message = []
+        append = message.append
+        messages = self.messages
 
-        for _, row in self.messages.iterrows():
-            content_ = row['content']
+        for node_id, role, sender, content_ in zip(
+            messages['node_id'], messages['role'], messages['sender'], messages['content']
+        ):
             if content_.startswith('Sender'):
                 content_ = content_.split(':', 1)[1]
-                
+
             if isinstance(content_, str):
                 try:
                     content_ = json.dumps(as_dict(content_))
                 except Exception as e:
-                    raise ValueError(f"Error in serealizing, {row['node_id']} {content_}: {e}")
-                
-            out = {"role": row['role'], "content": content_}
+                    raise ValueError(f"Error in serealizing, {node_id} {content_}: {e}")
+
             if with_sender:
-                out['content'] = f"Sender {row['sender']}: {content_}"
-            
-            message.append(out)
+                content_ = f"Sender {sender}: {content_}"
+            append({"role": role, "content": content_})
         return message
 
     def _is_invoked(self) -> bool:
@@ -1040,7 +1079,7 @@ class Branch:
             bool: True if the conversation has been invoked, False otherwise.
 
         """
-        content = self.messages.iloc[-1]['content']
+        content = self.messages['content'].iloc[-1]
         try:
             if (
                 as_dict(content)['action_response'].keys() >= {'function', 'arguments', 'output'}
@@ -1073,27 +1112,22 @@ class Branch:
         Raises:
             ValueError: If more than one message type is specified or if the parameters do not form a valid message.
         """
-        if sum(lcall([system, instruction, response], bool)) != 1:
+        if bool(system) + bool(instruction) + bool(response) != 1:
             raise ValueError("Error: Message must have one and only one role.")
-        
+
+        if response:
+            if isinstance(response, Message):
+                return response
+            return Response(response=response, sender=sender)
+        elif instruction:
+            if isinstance(instruction, Message):
+                return instruction
+            return Instruction(instruction=instruction,
+                               context=context, sender=sender)
         else:
-            if isinstance(any([system, instruction, response]), Message):
-                if system:
-                    return system
-                elif instruction:
-                    return instruction
-                elif response:
-                    return response
-
-            msg = 0
-            if response:
-                msg = Response(response=response, sender=sender)
-            elif instruction:
-                msg = Instruction(instruction=instruction, 
-                                  context=context, sender=sender)
-            elif system:
-                msg = System(system=system, sender=sender)
-            return msg
+            if isinstance(system, Message):
+                return system
+            return System(system=system, sender=sender)
 
     def _info(self, use_sender: bool = False) -> Dict[str, int]:
         """
@@ -1107,8 +1141,8 @@ class Branch:
         """
         messages = self.messages['sender'] if use_sender else self.messages['role']
         result = messages.value_counts().to_dict()
-        result['total'] = len(self.len_messages)
-        
+        result['total'] = len(messages)
+
         return result
 
 
@@ -1,11 +1,14 @@
+import asyncio
 from typing import Any, Dict, List, Optional, Union
-from lionagi.utils import as_dict, lcall, to_list, alcall, get_flattened_keys
+from lionagi.utils import as_dict, get_flattened_keys
 from lionagi.schema import Tool
 from lionagi.core.messages import Instruction, System
 
 
 class ChatFlow:
 
+    max_parallel_tools: int = 8
+
     @staticmethod
     async def call_chatcompletion(branch, sender=None, with_sender=False, tokenizer_kwargs={}, **kwargs):
         """
@@ -25,13 +28,13 @@ class ChatFlow:
         payload, completion = await branch.service.serve_chat(
             messages=messages, tokenizer_kwargs=tokenizer_kwargs, **kwargs
         )
-        if "choices" in completion:
-            add_msg_config = {"response":completion['choices'][0]}
-            if sender is not None:
-                add_msg_config["sender"] = sender
-
+        choices = completion.get("choices")
+        if choices is not None:
             branch.logger.add_entry({"input": payload, "output": completion})
-            branch.add_message(**add_msg_config)
+            if sender is not None:
+                branch.add_message(response=choices[0], sender=sender)
+            else:
+                branch.add_message(response=choices[0])
             branch.status_tracker.num_tasks_succeeded += 1
         else:
             branch.status_tracker.num_tasks_failed += 1
@@ -70,52 +73,64 @@ class ChatFlow:
         branch.add_message(instruction=instruction, context=context, sender=sender)
 
         if 'tool_parsed' in kwargs:
-            kwargs.pop('tool_parsed')
-            tool_kwarg = {'tools': tools}
-            kwargs = {**tool_kwarg, **kwargs}
+            del kwargs['tool_parsed']
+            kwargs.setdefault('tools', tools)
         else:
             if tools and branch.has_tools:
                 kwargs = branch.tool_manager._tool_parser(tools=tools, **kwargs)
 
-        config = {**branch.llmconfig, **kwargs}
-        if sender is not None: 
-            config.update({"sender": sender})
+        config = branch.llmconfig.copy()
+        config.update(kwargs)
+        if sender is not None:
+            config["sender"] = sender
         
         await branch.call_chatcompletion(**config)
-        
-        async def _output():
-            content_ = as_dict(branch.messages.content.iloc[-1])
-            if invoke:
-                try:
-                    tool_uses = content_
-                    func_calls = lcall(
-                        [as_dict(i) for i in tool_uses["action_list"]], 
-                        branch.tool_manager.get_function_call
+
+        content_ = as_dict(branch.messages.content.iloc[-1])
+        if invoke and branch.has_tools:
+            try:
+                tool_uses = content_
+                tool_manager = branch.tool_manager
+                get_function_call = tool_manager.get_function_call
+                func_calls = [
+                    get_function_call(as_dict(i))
+                    for i in tool_uses["action_list"]
+                ]
+
+                if len(func_calls) == 1:
+                    f = func_calls[0]
+                    out_ = await tool_manager.invoke(f)
+                    branch.add_message(
+                        response={
+                            "function": f[0],
+                            "arguments": f[1],
+                            "output": out_
+                        }
                     )
-                    
-                    outs = await alcall(func_calls, branch.tool_manager.invoke)
-                    outs = to_list(outs, flatten=True)
+                else:
+                    sem = asyncio.Semaphore(ChatFlow.max_parallel_tools)
 
-                    for out_, f in zip(outs, func_calls):
+                    async def _invoke(func_call):
+                        async with sem:
+                            return func_call, await tool_manager.invoke(func_call)
+
+                    for fut in asyncio.as_completed([_invoke(f) for f in func_calls]):
+                        f, out_ = await fut
                         branch.add_message(
                             response={
-                                "function": f[0], 
-                                "arguments": f[1], 
+                                "function": f[0],
+                                "arguments": f[1],
                                 "output": out_
                             }
                         )
-                except:
-                    pass
-            if out:
-                if (
-                    len(content_.items()) == 1 
-                    and len(get_flattened_keys(content_)) == 1
-                ):
-                    key = get_flattened_keys(content_)[0]
-                    return content_[key]
-                return content_
-        
-        return await _output()
+            except Exception:
+                pass
+        if out:
+            if len(content_) == 1:
+                flattened_keys = get_flattened_keys(content_)
+                if len(flattened_keys) == 1:
+                    return content_[flattened_keys[0]]
+            return content_
 
     @staticmethod
     async def ReAct(
@@ -6,6 +6,14 @@ from lionagi.utils.sys_util import strip_lower
 from lionagi.utils.nested_util import nget
 from lionagi.schema.base_node import BaseNode
 
+# (content field, content key, default sender) triples tried in order when
+# classifying a parsed assistant response.
+_RESPONSE_DISPATCH = (
+    ("tool_uses", "action_list", "action_request"),
+    ("response", "response", "assistant"),
+    ("action_list", "action_list", "action_request"),
+)
+
 
 class Message(BaseNode):
     """
@@ -111,18 +119,13 @@ class Response(Message):
 
             else:
                 try:
-                    if 'tool_uses' in json.loads(response['content']):
-                        content_ = json.loads(response['content'])['tool_uses']
-                        content_key = content_key or "action_list"
-                        sender = sender or "action_request"
-                    elif 'response' in json.loads(response['content']):
-                        sender = sender or "assistant"
-                        content_key = content_key or "response"
-                        content_ = json.loads(response['content'])['response']
-                    elif 'action_list' in json.loads(response['content']):
-                        sender = sender or "action_request"
-                        content_key = content_key or "action_list"
-                        content_ = json.loads(response['content'])['action_list']
+                    parsed_content = json.loads(response['content'])
+                    for field, key_, sender_ in _RESPONSE_DISPATCH:
+                        if field in parsed_content:
+                            content_ = parsed_content[field]
+                            content_key = content_key or key_
+                            sender = sender or sender_
+                            break
                     else:
                         content_ = response['content']
                         content_key = content_key or "response"
@@ -443,9 +443,7 @@ class Session:
         """
         return all messages across branches
         """
-        dfs = deque()
-        for _, v in self.branches:
-            dfs.append(to_df(v.messages))
+        dfs = [to_df(branch.messages) for branch in self.branches.values()]
         return to_df(to_list(dfs, flatten=True, dropna=True))
 
     def register_tools(self, tools):
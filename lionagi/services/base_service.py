@@ -2,6 +2,7 @@ import asyncio
 import logging
 import aiohttp
 from abc import ABC
+from collections import OrderedDict
 from dataclasses import dataclass
 from typing import Any, Dict, NoReturn, Optional, Type, List, Union
 
@@ -262,6 +263,7 @@ class BaseService:
 
     base_url: str = ''
     available_endpoints: list = []
+    max_connections: int = 100
 
     def __init__(
         self,
@@ -282,6 +284,21 @@ class BaseService:
             'max_tokens': max_tokens,
             'interval': interval
         }
+        self._http_session: Optional[aiohttp.ClientSession] = None
+        self._response_cache: OrderedDict = OrderedDict()
+        self._response_cache_maxsize: int = 128
+
+    async def _get_http_session(self) -> aiohttp.ClientSession:
+        """Returns the shared client session, creating it on first use."""
+        if self._http_session is None or self._http_session.closed:
+            connector = aiohttp.TCPConnector(limit=self.max_connections)
+            self._http_session = aiohttp.ClientSession(connector=connector)
+        return self._http_session
+
+    async def close(self) -> None:
+        """Closes the shared client session if one was created."""
+        if self._http_session is not None and not self._http_session.closed:
+            await self._http_session.close()
 
 
     async def init_endpoint(self, endpoint_: Optional[Union[List[str], List[EndPoint], str, EndPoint]] = None) -> None:
@@ -315,10 +332,13 @@ class BaseService:
                                 config=endpoint_config,
                             )
                         else:
+                            max_requests = endpoint_config.get('max_requests')
+                            max_tokens = endpoint_config.get('max_tokens')
+                            interval = endpoint_config.get('interval')
                             self.endpoints[ep] = EndPoint(
-                                max_requests=endpoint_config.get('max_requests', 1000) if endpoint_config.get('max_requests', 1000) is not None else 1000,
-                                max_tokens=endpoint_config.get('max_tokens', 100000) if endpoint_config.get('max_tokens', 100000) is not None else 100000,
-                                interval=endpoint_config.get('interval', 60) if endpoint_config.get('interval', 60) is not None else 60,
+                                max_requests=max_requests if max_requests is not None else 1000,
+                                max_tokens=max_tokens if max_tokens is not None else 100000,
+                                interval=interval if interval is not None else 60,
                                 endpoint_=ep,
                                 token_encoding_name=self.token_encoding_name,
                                 config=endpoint_config,
@@ -343,7 +363,7 @@ class BaseService:
                 if not self.endpoints[ep]._has_initialized:
                     await self.endpoints[ep].init_rate_limiter()
 
-    async def call_api(self, payload, endpoint, method, **kwargs):
+    async def call_api(self, payload, endpoint, method, cached=False, **kwargs):
         """
         Calls the specified API endpoint with the given payload and method.
 
@@ -351,6 +371,8 @@ class BaseService:
             payload: The payload to send with the API call.
             endpoint: The endpoint to call.
             method: The HTTP method to use for the call.
+            cached: If True, memoizes the completion for identical payloads.
+                Only opt in when responses are deterministic (e.g. temperature=0).
 
         Returns:
             The response from the API call.
@@ -360,11 +382,24 @@ class BaseService:
         """
         if endpoint not in self.endpoints.keys():
             raise ValueError(f'The endpoint {endpoint} has not initialized.')
-        async with aiohttp.ClientSession() as http_session:
-            completion = await self.endpoints[endpoint].rate_limiter._call_api(
-                http_session=http_session, endpoint=endpoint, base_url=self.base_url, api_key=self.api_key,
-                method=method, payload=payload, **kwargs)
-            return completion
+
+        cache_key = None
+        if cached:
+            cache_key = APIUtil.get_cache_key(self.base_url + endpoint, payload)
+            if cache_key in self._response_cache:
+                self._response_cache.move_to_end(cache_key)
+                return self._response_cache[cache_key]
+
+        http_session = await self._get_http_session()
+        completion = await self.endpoints[endpoint].rate_limiter._call_api(
+            http_session=http_session, endpoint=endpoint, base_url=self.base_url, api_key=self.api_key,
+            method=method, payload=payload, **kwargs)
+
+        if cached and completion is not None:
+            self._response_cache[cache_key] = completion
+            if len(self._response_cache) > self._response_cache_maxsize:
+                self._response_cache.popitem(last=False)
+        return completion
 
 
 class PayloadCreation:
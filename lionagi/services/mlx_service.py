@@ -1,3 +1,5 @@
+import asyncio
+
 from ..utils.sys_util import install_import, is_package_installed, as_dict
 from .base_service import BaseService
 
@@ -24,8 +26,9 @@ class MlXService(BaseService):
         payload = {'messages': messages}
         
         try:
-            response = self.generate(
-                self.model, self.tokenizer, prompt=f"{prompts[-1]} \nOutput: ", **kwargs
+            response = await asyncio.to_thread(
+                self.generate, self.model, self.tokenizer,
+                prompt=f"{prompts[-1]} \nOutput: ", **kwargs
             )
             completion = {
                 'model': self.model_name, 
@@ -37,6 +37,8 @@ class OpenAIService(BaseService):
             **kwargs
         )
         self.active_endpoint = []
+        self._chat_config = None
+        self._chat_schema = None
 
     async def serve(self, input_, endpoint="chat/completions", method="post", tokenizer_kwargs={}, **kwargs):
         """
@@ -87,8 +89,10 @@ class OpenAIService(BaseService):
         if "chat/completions" not in self.active_endpoint:
             await self. init_endpoint("chat/completions")
             self.active_endpoint.append("chat/completions")
+            self._chat_config = self.endpoints["chat/completions"].config
+            self._chat_schema = self.schema["chat/completions"]
         payload = PayloadCreation.chat_completion(
-            messages, self.endpoints["chat/completions"].config, self.schema["chat/completions"], **kwargs)
+            messages, self._chat_config, self._chat_schema, **kwargs)
 
         try:
             completion = await self.call_api(payload, "chat/completions", "post", **tokenizer_kwargs)
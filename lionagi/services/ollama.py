@@ -1,3 +1,5 @@
+import asyncio
+
 from ..utils.sys_util import install_import, is_package_installed
 from .base_service import BaseService
 
@@ -18,9 +20,12 @@ class OllamaService(BaseService):
         
         self.model = model
         self.client = self.ollama.AsyncClient(**kwargs)
+        self._pulled_models = set()
 
     async def serve_chat(self, messages, **kwargs):
-        self.ollama.pull(self.model)
+        if self.model not in self._pulled_models:
+            await asyncio.to_thread(self.ollama.pull, self.model)
+            self._pulled_models.add(self.model)
         payload = {'messages': messages}
 
         try:
@@ -1,9 +1,13 @@
 from typing import Union, Dict, Any
+import asyncio
+import re
 import subprocess
 
 from ..utils.sys_util import install_import, get_cpu_architecture, is_package_installed
 from .base_service import BaseService
 
+_generated_text_cleanup = re.compile(r"\\n|\[\'|\\")
+
 
 def get_pytorch_install_command():
     cpu_arch = get_cpu_architecture()
@@ -57,10 +61,10 @@ class TransformersService(BaseService):
                 raise ValueError(f"Invalid transformers pipeline task: {self.task}.")
 
         payload = {'messages': messages}
-        conversation = self.pipe(str(messages), **kwargs)
+        conversation = await asyncio.to_thread(self.pipe, str(messages), **kwargs)
             
         texts = conversation[-1]['generated_text']
-        msgs = str(texts.split(']')[1:]).replace('\\n', '').replace("[\'", "").replace('\\', '')
+        msgs = _generated_text_cleanup.sub('', str(texts.split(']')[1:]))
         
         completion = {
                       "model": self.pipe.model,
@@ -1,7 +1,6 @@
 from typing import List, Any
 from pydantic import Field
 
-from ..utils.call_util import lcall
 from ..schema.base_schema import BaseNode
 from .relationship import Relationship
 
@@ -26,9 +25,9 @@ class Graph(BaseNode):
         >>> graph.relationship_exists(relationship)
         True
     """
-    nodes: dict = Field(default={})
-    relationships: dict = Field(default={})
-    node_relationships: dict = Field(default={})
+    nodes: dict = Field(default_factory=dict)
+    relationships: dict = Field(default_factory=dict)
+    node_relationships: dict = Field(default_factory=dict)
 
     def add_node(self, node: BaseNode) -> None:
         """
@@ -51,9 +50,9 @@ class Graph(BaseNode):
         Raises:
             KeyError: If either the source or target node of the relationship is not found in the graph.
         """
-        if relationships.source_node_id not in self.node_relationships.keys():
+        if relationships.source_node_id not in self.node_relationships:
             raise KeyError(f'node {relationships.source_node_id} is not found.')
-        if relationships.target_node_id not in self.node_relationships.keys():
+        if relationships.target_node_id not in self.node_relationships:
             raise KeyError(f'node {relationships.target_node_id} is not found.')
 
         self.relationships[relationships.id_] = relationships
@@ -77,17 +76,15 @@ class Graph(BaseNode):
         if node is None:
             return list(self.relationships.values())
 
-        if node.id_ not in self.nodes.keys():
+        if node.id_ not in self.nodes:
             raise KeyError(f'node {node.id_} is not found')
 
-        if out_edge:
-            relationship_ids = list(self.node_relationships[node.id_]['out'].keys())
-            relationships = lcall(relationship_ids, lambda i: self.relationships[i])
-            return relationships
-        else:
-            relationship_ids = list(self.node_relationships[node.id_]['in'].keys())
-            relationships = lcall(relationship_ids, lambda i: self.relationships[i])
-            return relationships
+        direction = 'out' if out_edge else 'in'
+        relationships = self.relationships
+        return [
+            relationships[i]
+            for i in self.node_relationships[node.id_][direction]
+        ]
 
     def remove_node(self, node: BaseNode)-> BaseNode:
         """
@@ -102,7 +99,7 @@ class Graph(BaseNode):
         Raises:
             KeyError: If the node is not found in the graph.
         """
-        if node.id_ not in self.nodes.keys():
+        if node.id_ not in self.nodes:
             raise KeyError(f'node {node.id_} is not found')
 
         out_relationship = self.node_relationships[node.id_]['out']
@@ -131,7 +128,7 @@ class Graph(BaseNode):
         Raises:
             KeyError: If the relationship is not found in the graph.
         """
-        if relationship.id_ not in self.relationships.keys():
+        if relationship.id_ not in self.relationships:
             raise KeyError(f'relationship {relationship.id_} is not found')
 
         self.node_relationships[relationship.source_node_id]['out'].pop(relationship.id_)
@@ -149,7 +146,7 @@ class Graph(BaseNode):
         Returns:
             bool: True if the node exists, False otherwise.
         """
-        if node.id_ in self.nodes.keys():
+        if node.id_ in self.nodes:
             return True
         else:
             return False
@@ -164,7 +161,7 @@ class Graph(BaseNode):
         Returns:
             bool: True if the relationship exists, False otherwise.
         """
-        if relationship.id_ in self.relationships.keys():
+        if relationship.id_ in self.relationships:
             return True
         else:
             return False
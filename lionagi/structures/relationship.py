@@ -21,7 +21,7 @@ class Relationship(BaseNode):
 
     source_node_id: str
     target_node_id: str
-    condition: dict = Field(default={})
+    condition: dict = Field(default_factory=dict)
 
     def add_condition(self, condition: Dict[str, Any]) -> None:
         """
@@ -1,3 +1,4 @@
+from pydantic import Field
 from typing import TypeVar
 from ..schema.base_schema import BaseNode
 from .graph import Graph
@@ -11,7 +12,7 @@ class Structure(BaseNode):
     """
     Represents the structure of a graph consisting of nodes and relationships.
     """
-    graph: Graph = Graph()
+    graph: Graph = Field(default_factory=Graph)
 
     def add_node(self, node: T) -> None:
         """
@@ -1,5 +1,6 @@
 from ..schema.base_schema import Tool
 
+import functools
 import inspect
 
 def _extract_docstring_details_google(func):
@@ -110,6 +111,7 @@ def _extract_docstring_details_rest(func):
 
     return func_description, params_description
 
+@functools.lru_cache(maxsize=None)
 def _extract_docstring_details(func, style='google'):
     """
     Extracts the function description and parameter descriptions from the
@@ -13,6 +13,10 @@ from typing import Any, Callable, Dict, Optional
 
 from .sys_util import strip_lower
 
+_ALLOWED_API_METHODS = frozenset({"post", "delete", "head", "options", "patch"})
+_ENDPOINT_PATTERN = re.compile(r"^https://[^/]+(/.+)?/v\d+/(.+)$")
+
+
 class APIUtil:
     """
     A utility class for assisting with common API usage patterns.
@@ -39,7 +43,7 @@ class APIUtil:
             >>> print(post_method)
             <bound method ClientSession._request of <aiohttp.client.ClientSession object at 0x...>>
         """
-        if method not in ["post", "delete", "head", "options", "patch"]:
+        if method not in _ALLOWED_API_METHODS:
             raise ValueError("Invalid request, method must be in ['post', 'delete', 'head', 'options', 'patch']")
         return getattr(http_session, method)
 
@@ -108,7 +112,7 @@ class APIUtil:
             >>> api_endpoint_from_url(invalid_url)
             ''
         """
-        match = re.search(r"^https://[^/]+(/.+)?/v\d+/(.+)$", request_url)
+        match = _ENDPOINT_PATTERN.search(request_url)
         return match.group(2) if match else ""
 
     @staticmethod
@@ -212,14 +216,18 @@ class APIUtil:
             >>> response.status
             200
         """
+        def _read_file():
+            with open(file_path, 'rb') as file:
+                return file.read()
+
         for attempt in range(retries):
             try:
-                with open(file_path, 'rb') as file:
-                    files = {param_name: file}
-                    additional_data = additional_data if additional_data else {}
-                    async with http_session.post(url, data={**files, **additional_data}) as response:
-                        response.raise_for_status()
-                        return await response.json()
+                file_content = await asyncio.to_thread(_read_file)
+                files = {param_name: file_content}
+                additional_data = additional_data if additional_data else {}
+                async with http_session.post(url, data={**files, **additional_data}) as response:
+                    response.raise_for_status()
+                    return await response.json()
             except aiohttp.ClientError as e:
                 if attempt == retries - 1:
                     raise e
@@ -315,8 +323,11 @@ class APIUtil:
 
         if disallowed_special:
             kwargs['disallowed_special'] = disallowed_special
-            
-        encoding = tiktoken.get_encoding(token_encoding_name, **kwargs)
+
+        if kwargs:
+            encoding = tiktoken.get_encoding(token_encoding_name, **kwargs)
+        else:
+            encoding = APIUtil._get_token_encoding(token_encoding_name)
         if api_endpoint.endswith("completions"):
             max_tokens = payload.get("max_tokens", 15)
             n = payload.get("n", 1)
@@ -324,16 +335,18 @@ class APIUtil:
 
             # chat completions
             if api_endpoint.startswith("chat/"):
-                num_tokens = 0
-                for message in payload["messages"]:
-                    num_tokens += 4  # every message follows <im_start>{role/name}\n{content}<im_end>\n
+                messages_ = payload["messages"]
+                values = []
+                name_count = 0
+                for message in messages_:
                     for key, value in message.items():
-                        num_tokens += len(encoding.encode(value))
+                        values.append(value)
                         if key == "name":  # if there's a name, the role is omitted
-                            num_tokens -= (
-                                1  # role is always required and always 1 token
-                            )
-                num_tokens += 2  # every reply is primed with <im_start>assistant
+                            name_count += 1  # role is always required and always 1 token
+                # every message follows <im_start>{role/name}\n{content}<im_end>\n,
+                # every reply is primed with <im_start>assistant
+                num_tokens = 4 * len(messages_) + 2 - name_count
+                num_tokens += sum(len(t) for t in encoding.encode_batch(values))
                 return num_tokens + completion_tokens
             # normal completions
             else:
@@ -343,7 +356,7 @@ class APIUtil:
                     num_tokens = prompt_tokens + completion_tokens
                     return num_tokens
                 elif isinstance(prompt, list):  # multiple prompts
-                    prompt_tokens = sum([len(encoding.encode(p)) for p in prompt])
+                    prompt_tokens = sum(len(t) for t in encoding.encode_batch(prompt))
                     num_tokens = prompt_tokens + completion_tokens * len(prompt)
                     return num_tokens
                 else:
@@ -356,7 +369,7 @@ class APIUtil:
                 num_tokens = len(encoding.encode(input))
                 return num_tokens
             elif isinstance(input, list):  # multiple inputs
-                num_tokens = sum([len(encoding.encode(i)) for i in input])
+                num_tokens = sum(len(t) for t in encoding.encode_batch(input))
                 return num_tokens
             else:
                 raise TypeError(
@@ -367,18 +380,28 @@ class APIUtil:
                 f'API endpoint "{api_endpoint}" not implemented in this script'
             )
 
+    @staticmethod
+    @lru_cache(maxsize=None)
+    def _get_token_encoding(token_encoding_name: str):
+        """
+        Returns the tiktoken encoding for the given name, cached across calls.
+        """
+        return tiktoken.get_encoding(token_encoding_name)
+
     @staticmethod
     def _create_payload(input_, config, required_, optional_, input_key,**kwargs):
-        config = {**config, **kwargs}
+        config = config.copy()
+        config.update(kwargs)
         payload = {input_key: input_}
-        
+
         for key in required_:
-            payload.update({key: config[key]})
+            payload[key] = config[key]
 
         for key in optional_:
-            if bool(config[key]) is True and strip_lower(config[key]) != "none":
-                payload.update({key: config[key]})
-                
+            value = config[key]
+            if bool(value) is True and strip_lower(value) != "none":
+                payload[key] = value
+
         return payload
 
     # @staticmethod
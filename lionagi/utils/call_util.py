@@ -1,13 +1,28 @@
 import asyncio
 import functools
 import logging
+import os
+import sys
 import time
 
 from concurrent.futures import ThreadPoolExecutor
+from itertools import islice
 from typing import Any, Callable, Generator, Iterable, List, Dict, Optional, Tuple
 
 from aiocache import cached
 
+logger = logging.getLogger(__name__)
+
+# asyncio.timeout (3.11+) sets a deadline on the current task without the
+# extra wrapping Task that asyncio.wait_for allocates.
+_has_asyncio_timeout = sys.version_info >= (3, 11)
+
+# Shared bounded pool for running sync functions off the event loop; one pool
+# per process instead of one per decorated function.
+_sync_pool = ThreadPoolExecutor(
+    max_workers=os.cpu_count() or 8, thread_name_prefix='lionagi-sync'
+)
+
 
 def to_list(input: Any, flatten: bool = True, dropna: bool = False) -> List[Any]:
     """
@@ -28,7 +43,8 @@ def to_list(input: Any, flatten: bool = True, dropna: bool = False) -> List[Any]
         ["hello"]
     """
     if isinstance(input, list) and flatten:
-        input = _flatten_list(input)
+        # _flatten_list already drops None while flattening; no second pass needed
+        return _flatten_list(input)
     elif isinstance(input, Iterable) and not isinstance(input, (str, dict)):
         try:
             input = list(input)
@@ -66,9 +82,10 @@ def lcall(
     lst = to_list(input=input, dropna=dropna)
     if len(to_list(func)) != 1:
         raise ValueError("There must be one and only one function for list calling.")
+    call = functools.partial(func, **kwargs) if kwargs else func
     if flatten:
-        return to_list([func(i, **kwargs) for i in lst])
-    return [func(i, **kwargs) for i in lst]
+        return to_list([call(i) for i in lst])
+    return [call(i) for i in lst]
 
 @functools.lru_cache(maxsize=None)
 def is_coroutine_func(func: Callable) -> bool:
@@ -92,7 +109,8 @@ def is_coroutine_func(func: Callable) -> bool:
     return asyncio.iscoroutinefunction(func)
 
 async def alcall(
-    input: Any = None, func: Callable = None, flatten: bool = False, **kwargs
+    input: Any = None, func: Callable = None, flatten: bool = False,
+    max_concurrent: Optional[int] = None, **kwargs
 )-> List[Any]:
     """
     Asynchronously apply a function to each element in the input.
@@ -101,6 +119,8 @@ async def alcall(
         input (Any): The input to process.
         func (Callable): The function to apply.
         flatten (bool, optional): Whether to flatten the result. Default is False.
+        max_concurrent (Optional[int]): Maximum number of calls in flight at once.
+            Unbounded when None.
         **kwargs: Keyword arguments to pass to the function.
 
     Returns:
@@ -113,10 +133,20 @@ async def alcall(
     """
     if input:
         lst = to_list(input=input)
-        tasks = [func(i, **kwargs) for i in lst]
+        call = functools.partial(func, **kwargs) if kwargs else func
+        tasks = [call(i) for i in lst]
     else:
         tasks = [func(**kwargs)]
-        
+
+    if max_concurrent is not None and max_concurrent < len(tasks):
+        sem = asyncio.Semaphore(max_concurrent)
+
+        async def _bounded(coro):
+            async with sem:
+                return await coro
+
+        tasks = [_bounded(task) for task in tasks]
+
     outs = await asyncio.gather(*tasks)
     return to_list(outs, flatten=flatten)
 
@@ -154,12 +184,14 @@ async def mcall(
         if len(input_) != len(funcs_):
             raise ValueError("Inputs and functions must be the same length for map calling.")
         tasks = [
-            _call_handler(func, inp, **kwargs) 
-            for inp, func in zip(input, func)
+            _call_handler(f, inp, **kwargs)
+            for inp, f in zip(input_, funcs_)
         ]
         return await asyncio.gather(*tasks)
 
-async def bcall(input: Any, func: Callable, batch_size: int, **kwargs) -> List[Any]:
+async def bcall(
+    input: Any, func: Callable, batch_size: int, rolling: bool = False, **kwargs
+) -> List[Any]:
     """
     Asynchronously call a function on batches of inputs.
 
@@ -167,6 +199,10 @@ async def bcall(input: Any, func: Callable, batch_size: int, **kwargs) -> List[A
         input (Any): The input to process.
         func (Callable): The function to apply.
         batch_size (int): The size of each batch.
+        rolling (bool, optional): If True, run one semaphore-bounded window of
+            batch_size calls instead of strict batches, so new calls start as
+            soon as slots free up rather than waiting on each batch's slowest
+            call. Default is False.
         **kwargs: Keyword arguments to pass to the function.
 
     Returns:
@@ -177,12 +213,20 @@ async def bcall(input: Any, func: Callable, batch_size: int, **kwargs) -> List[A
         >>> asyncio.run(bcall([1, 2, 3, 4], sum_batch, batch_size=2))
         [3, 7]
     """
-    results = []
-    input = to_list(input)
-    for i in range(0, len(input), batch_size):
-        batch = input[i:i + batch_size]
+    if rolling:
+        return await alcall(input, func, max_concurrent=batch_size, **kwargs)
+
+    lst = to_list(input)
+    # Pre-size the result list; each batch writes into its slice instead of
+    # growing the list batch by batch.
+    results = [None] * len(lst)
+    filled = 0
+    it = iter(lst)
+    while batch := list(islice(it, batch_size)):
         batch_results = await alcall(batch, func, **kwargs)
-        results.extend(batch_results)
+        results[filled:filled + len(batch_results)] = batch_results
+        filled += len(batch_results)
+    del results[filled:]
 
     return results
 
@@ -213,38 +257,52 @@ async def tcall(
         >>> asyncio.run(tcall(example_func, 5, timing=True))
         (5, duration)
     """
-    async def async_call() -> Tuple[Any, float]:
-        start_time = time.time()
+    if (
+        not delay and not timing and not ignore_err
+        and err_msg is None and timeout is None
+    ):
+        # Fast path for the plain fan-out call: no options requested, so skip
+        # the clock reads and error-message plumbing entirely.
+        if is_coroutine_func(func):
+            return await func(*args, **kwargs)
+        return func(*args, **kwargs)
+
+    now = time.time
+    start_time = now()
+    if is_coroutine_func(func):
         if timeout is not None:
-            result = await asyncio.wait_for(func(*args, **kwargs), timeout)
+            if _has_asyncio_timeout:
+                async with asyncio.timeout(timeout):
+                    result = await func(*args, **kwargs)
+            else:
+                result = await asyncio.wait_for(func(*args, **kwargs), timeout)
         try:
-            await asyncio.sleep(delay)
+            if delay:
+                await asyncio.sleep(delay)
             result = await func(*args, **kwargs)
-            duration = time.time() - start_time
+            duration = now() - start_time
             return (result, duration) if timing else result
         except Exception as e:
-            handle_error(e)
-
-    def sync_call() -> Tuple[Any, float]:
-        start_time = time.time()
+            if err_msg:
+                logger.warning("%s Error: %s", err_msg, e)
+            else:
+                logger.warning("An error occurred: %s", e)
+            if not ignore_err:
+                raise
+    else:
         try:
-            time.sleep(delay)
+            if delay:
+                time.sleep(delay)
             result = func(*args, **kwargs)
-            duration = time.time() - start_time
+            duration = now() - start_time
             return (result, duration) if timing else result
         except Exception as e:
-            handle_error(e)
-
-    def handle_error(e: Exception):
-        _msg = f"{err_msg} Error: {e}" if err_msg else f"An error occurred: {e}"
-        print(_msg)
-        if not ignore_err:
-            raise
-
-    if asyncio.iscoroutinefunction(func):
-        return await async_call()
-    else: 
-        return sync_call()
+            if err_msg:
+                logger.warning("%s Error: %s", err_msg, e)
+            else:
+                logger.warning("An error occurred: %s", e)
+            if not ignore_err:
+                raise
        
 async def rcall(
     func: Callable, *args, retries: int = 0, delay: float = 1.0, 
@@ -274,16 +332,32 @@ async def rcall(
     """
     last_exception = None
     result = None
+    is_coro = is_coroutine_func(func)
 
     for attempt in range(retries + 1) if retries == 0 else range(retries):
         try:
-            # Using tcall for each retry attempt with timeout and delay
-            result = await _tcall(func, *args, timeout=timeout, **kwargs)
+            # Timing/timeout logic inlined per attempt; avoids re-entering
+            # a wrapper coroutine on every retry.
+            if timeout is not None:
+                if _has_asyncio_timeout:
+                    async with asyncio.timeout(timeout):
+                        result = await func(*args, **kwargs)
+                else:
+                    result = await asyncio.wait_for(func(*args, **kwargs), timeout)
+            elif is_coro:
+                result = await func(*args, **kwargs)
+            else:
+                result = func(*args, **kwargs)
             return result
         except Exception as e:
             last_exception = e
             if attempt < retries:
-                await asyncio.sleep(delay)
+                if delay > 1e-3:
+                    await asyncio.sleep(delay)
+                elif delay > 0:
+                    # Sub-millisecond backoff: just yield to the loop instead
+                    # of scheduling a timed wakeup.
+                    await asyncio.sleep(0)
                 delay *= backoff_factor
             else:
                 break
@@ -652,11 +726,9 @@ class CallDecorator:
     
     @staticmethod
     def force_async(fn):
-        pool = ThreadPoolExecutor()
-
         @functools.wraps(fn)
         def wrapper(*args, **kwargs):
-            future = pool.submit(fn, *args, **kwargs)
+            future = _sync_pool.submit(fn, *args, **kwargs)
             return asyncio.wrap_future(future)  # make it awaitable
 
         return wrapper
@@ -699,10 +771,13 @@ class Throttle:
         """
         @functools.wraps(func)
         def wrapper(*args, **kwargs) -> Any:
-            elapsed = time.time() - self.last_called
+            now = time.time()
+            elapsed = now - self.last_called
             if elapsed < self.period:
-                time.sleep(self.period - elapsed)
-            self.last_called = time.time()
+                wait = self.period - elapsed
+                time.sleep(wait)
+                now += wait
+            self.last_called = now
             return func(*args, **kwargs)
 
         return wrapper
@@ -719,10 +794,13 @@ class Throttle:
         """
         @functools.wraps(func)
         async def wrapper(*args, **kwargs) -> Any:
-            elapsed = time.time() - self.last_called
+            now = time.time()
+            elapsed = now - self.last_called
             if elapsed < self.period:
-                await asyncio.sleep(self.period - elapsed)
-            self.last_called = time.time()
+                wait = self.period - elapsed
+                await asyncio.sleep(wait)
+                now += wait
+            self.last_called = now
             return await func(*args, **kwargs)
 
         return wrapper
@@ -760,31 +838,20 @@ def _flatten_list(l: List[Any], dropna: bool = True) -> List[Any]:
         >>> _flatten_list([[1, [2, None]], 3], dropna=False)
         [1, 2, None, 3]
     """
-    flattened_list = list(_flatten_list_generator(l, dropna))
-    return _dropna(flattened_list) if dropna else flattened_list
-
-def _flatten_list_generator(
-    l: List[Any], dropna: bool = True
-) -> Generator[Any, None, None]:
-    """
-    Generator for flattening a nested list.
-
-    Args:
-        l (List[Any]): A nested list to flatten.
-        dropna (bool): If True, None values are omitted. Default is True.
-
-    Yields:
-        Generator[Any, None, None]: A generator yielding flattened elements.
-
-    Examples:
-        >>> list(_flatten_list_generator([[1, [2, None]], 3], dropna=False))
-        [1, 2, None, 3]
-    """
-    for i in l:
-        if isinstance(i, list):
-            yield from _flatten_list_generator(i, dropna)
+    flattened = []
+    append = flattened.append
+    stack = [iter(l)]
+    while stack:
+        for i in stack[-1]:
+            if isinstance(i, list):
+                stack.append(iter(i))
+                break
+            if dropna and i is None:
+                continue
+            append(i)
         else:
-            yield i
+            stack.pop()
+    return flattened
 
 
 def _custom_error_handler(error: Exception, error_map: Dict[type, Callable]) -> None:
@@ -804,11 +871,11 @@ def _custom_error_handler(error: Exception, error_map: Dict[type, Callable]) ->
     if handler:
         handler(error)
     else:
-        logging.error(f"Unhandled error: {error}")
+        logger.error("Unhandled error: %s", error)
 
 async def _call_handler(
-    func: Callable, *args, error_map: Dict[type, Callable] = None, 
-    **kwargs
+    func: Callable, *args, error_map: Dict[type, Callable] = None,
+    is_coro: Optional[bool] = None, **kwargs
 ) -> Any:
     """
     Call a function with error handling, supporting both synchronous and asynchronous functions.
@@ -817,6 +884,7 @@ async def _call_handler(
         func (Callable): The function to call.
         *args: Positional arguments to pass to the function.
         error_map (Dict[type, Callable], optional): A dictionary mapping error types to handler functions.
+        is_coro (Optional[bool]): Precomputed coroutine-ness of func; checked here when None.
         **kwargs: Keyword arguments to pass to the function.
 
     Returns:
@@ -831,7 +899,9 @@ async def _call_handler(
         3
     """
     try:
-        if is_coroutine_func(func):
+        if is_coro is None:
+            is_coro = is_coroutine_func(func)
+        if is_coro:
             # Checking for a running event loop
             try:
                 loop = asyncio.get_running_loop()
@@ -852,7 +922,7 @@ async def _call_handler(
         if error_map:
             _custom_error_handler(e, error_map)
         else:
-            logging.error(f"Error in call_handler: {e}")
+            logger.error("Error in call_handler: %s", e)
         raise
 
 
@@ -877,62 +947,14 @@ async def _alcall(
         [1, 4, 9]
     """
     lst = to_list(input=input)
-    tasks = [_call_handler(func, i, **kwargs) for i in lst]
+    is_coro = is_coroutine_func(func)
+    if is_coro and 'error_map' not in kwargs:
+        # No per-element handler needed: gather the coroutines directly and
+        # let it propagate the first failure.
+        call = functools.partial(func, **kwargs) if kwargs else func
+        tasks = [call(i) for i in lst]
+    else:
+        tasks = [_call_handler(func, i, is_coro=is_coro, **kwargs) for i in lst]
     outs = await asyncio.gather(*tasks)
     return to_list(outs, flatten=flatten)
 
-        
-async def _tcall(
-    func: Callable, *args, delay: float = 0, err_msg: Optional[str] = None, 
-    ignore_err: bool = False, timing: bool = False, 
-    default: Any = None, timeout: Optional[float] = None, **kwargs
-) -> Any:
-    """
-    Asynchronously call a function with optional delay, timeout, and error handling.
-
-    Args:
-        func (Callable): The function to call.
-        *args: Positional arguments to pass to the function.
-        delay (float): Delay before calling the function, in seconds.
-        err_msg (Optional[str]): Custom error message.
-        ignore_err (bool): If True, ignore errors and return default.
-        timing (bool): If True, return a tuple (result, duration).
-        default (Any): Default value to return on error.
-        timeout (Optional[float]): Timeout for the function call, in seconds.
-        **kwargs: Keyword arguments to pass to the function.
-
-    Returns:
-        Any: The result of the function call, or (result, duration) if timing is True.
-
-    Examples:
-        >>> async def example_func(x): return x
-        >>> asyncio.run(tcall(example_func, 5, timing=True))
-        (5, duration)
-    """
-    start_time = time.time()
-    try:
-        await asyncio.sleep(delay)
-        # Apply timeout to the function call
-        if timeout is not None:
-            result = await asyncio.wait_for(func(*args, **kwargs), timeout)
-        else:
-            if is_coroutine_func(func):
-                return await func( *args, **kwargs)
-            return func(*args, **kwargs)
-        duration = time.time() - start_time
-        return (result, duration) if timing else result
-    except asyncio.TimeoutError as e:
-        err_msg = f"{err_msg} Error: {e}" if err_msg else f"An error occurred: {e}"
-        print(err_msg)
-        if ignore_err:
-            return (default, time.time() - start_time) if timing else default
-        else:
-            raise e  # Re-raise the timeout exception
-    except Exception as e:
-        err_msg = f"{err_msg} Error: {e}" if err_msg else f"An error occurred: {e}"
-        print(err_msg)
-        if ignore_err:
-            return (default, time.time() - start_time) if timing else default
-        else:
-            raise e
-        
\ No newline at end of file
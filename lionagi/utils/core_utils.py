@@ -1,11 +1,13 @@
 import pandas as pd
-import json
 from datetime import datetime
 from typing import Union, Optional
 
 from .sys_util import strip_lower, to_df, as_dict
 from .nested_util import nget
 
+_MESSAGE_COLUMNS = ['node_id', 'role', 'sender', 'timestamp', 'content']
+_MESSAGE_ROLES = frozenset({'system', 'user', 'assistant'})
+
 
 class CoreUtil:
 
@@ -24,17 +26,17 @@ class CoreUtil:
             ValueError: If the DataFrame has unmatched columns, contains null values, has an unsupported role, or
                         if the content cannot be parsed as a JSON string.
         """
-        if list(messages.columns) != ['node_id', 'role', 'sender', 'timestamp', 'content']:
+        if list(messages.columns) != _MESSAGE_COLUMNS:
             raise ValueError('Invalid messages dataframe. Unmatched columns.')
         if messages.isnull().values.any():
             raise ValueError('Invalid messages dataframe. Cannot have null.')
-        if not all(role in ['system', 'user', 'assistant'] for role in messages['role'].unique()):
+        if not _MESSAGE_ROLES.issuperset(messages['role'].unique()):
             raise ValueError('Invalid messages dataframe. Cannot have role other than ["system", "user", "assistant"].')
         for cont in messages['content']:
             if cont.startswith('Sender'):
                 cont = cont.split(':', 1)[1]
             try:
-                json.loads(cont)
+                as_dict(cont)
             except:
                 raise ValueError('Invalid messages dataframe. Content expect json string.')
         return True
@@ -86,14 +88,11 @@ class CoreUtil:
         Returns:
             pd.DataFrame: A DataFrame containing rows where the 'content' column matches the search criteria.
         """
-        out = ''
         if isinstance(keywords, list):
             keywords = '|'.join(keywords)
-        if not case_sensitive:
-            out = messages[
-                messages["content"].str.contains(keywords, case=False)
-            ]        
-        out = messages[messages["content"].str.contains(keywords)]
+        out = messages[
+            messages["content"].str.contains(keywords, case=case_sensitive)
+        ]
         if reset_index or dropna:
             out = to_df(out, reset_index=reset_index)
         return out
@@ -128,11 +127,13 @@ class CoreUtil:
         """
 
         try:
-            outs = messages.copy()
-            
+            outs = messages
+
             if content_keywords:
-                outs = CoreUtil.search_keywords(content_keywords, case_sensitive)
-            
+                outs = CoreUtil.search_keywords(
+                    outs, content_keywords, case_sensitive=case_sensitive
+                )
+
             outs = outs[outs['role'] == role] if role else outs
             outs = outs[outs['sender'] == sender] if sender else outs
             outs = outs[outs['timestamp'] > start_time] if start_time else outs
@@ -307,32 +308,32 @@ class CoreUtil:
     @staticmethod
     def to_markdown_string(df):
         answers = []
-        for _, i in df.iterrows():
-            content = as_dict(i.content)
-            
-            if i.role == "assistant":
+        append = answers.append
+        for role, content_ in zip(df['role'], df['content']):
+            content = as_dict(content_)
+
+            if role == "assistant":
                 try:
                     a = nget(content, ['action_response', 'func'])
                     b = nget(content, ['action_response', 'arguments'])
                     c = nget(content, ['action_response', 'output'])
                     if a is not None:
-                        answers.append(f"Function: {a}")
-                        answers.append(f"Arguments: {b}")
-                        answers.append(f"Output: {c}")
+                        append(f"Function: {a}")
+                        append(f"Arguments: {b}")
+                        append(f"Output: {c}")
                     else:
-                        answers.append(nget(content, ['response']))
+                        append(nget(content, ['response']) or "")
                 except:
                     pass
-            elif i.role == "user":
+            elif role == "user":
                 try:
-                    answers.append(nget(content, ['instruction']))
+                    append(nget(content, ['instruction']) or "")
                 except:
                     pass
             else:
                 try:
-                    answers.append(nget(content, ['system_info']))
+                    append(nget(content, ['system_info']) or "")
                 except:
                     pass
-        
-        out_ = "\n".join(answers)
-        return out_
+
+        return "\n".join(answers)
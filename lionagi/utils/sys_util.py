@@ -13,6 +13,13 @@ import logging
 import pandas as pd
 from typing import Any, List, Dict
 
+try:
+    import orjson as _orjson
+except ImportError:
+    _orjson = None
+
+_number_regex = re.compile(r'-?\d+\.?\d*')
+
 
 def as_dict(input_: Any) -> Dict[Any, Any]:
     """
@@ -30,6 +37,11 @@ def as_dict(input_: Any) -> Dict[Any, Any]:
     """
     if isinstance(input_, str):
         try:
+            if _orjson is not None:
+                try:
+                    return _orjson.loads(input_)
+                except Exception:
+                    return json.loads(input_)
             return json.loads(input_)
         except Exception as e:
             raise ValueError(f"Could not convert input to dict: {e}") from e
@@ -129,6 +141,7 @@ def create_path(
         If the directory does not exist, it will be created unless dir_exist_ok is False.
         The timestamp format is YYYYMMDD_HHMMSS.
     """
+    dir = os.fspath(dir)
     dir = dir + '/' if not dir.endswith('/') else dir
     if '.' in filename:
         name, ext = filename.rsplit('.', 1)
@@ -351,8 +364,8 @@ def is_same_dtype(input_: Any, dtype: type = None) -> bool:
         return all(isinstance(i, dtype) for i in input_)
     
     elif isinstance(input_, dict):
-        dtype = dtype or type(list(input_.values())[0])
-        return (isinstance(v, dtype) for _, v in input_.items())
+        dtype = dtype or type(next(iter(input_.values())))
+        return all(isinstance(v, dtype) for v in input_.values())
 
     else:
         dtype = dtype or type(input_)
@@ -382,9 +395,10 @@ def to_df(
         dfs = ''
         
         if isinstance(item, List):
-            if is_same_dtype(item, pd.DataFrame):
+            if item and is_same_dtype(item, pd.DataFrame):
                 dfs = pd.concat(item)
-            dfs = pd.DataFrame(item)
+            else:
+                dfs = pd.DataFrame(item)
 
         elif isinstance(item, pd.DataFrame):
             dfs = item
@@ -424,7 +438,7 @@ def _extract_first_number(inputstr: str) -> str:
     Returns:
         str: The first number found in the string, or None if no numbers are found.
     """
-    numbers = re.findall(r'-?\d+\.?\d*', inputstr)
+    numbers = _number_regex.findall(inputstr)
     return numbers[0] if numbers else None
 
 def _convert_to_num(number_str: str, num_type: type = int, precision: int = None) -> Any: